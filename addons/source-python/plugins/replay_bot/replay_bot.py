@@ -7,13 +7,22 @@
 # ==============================================================================
 # Python
 import time
+import zlib
 
+from array import array
+from collections import Counter
 from enum import IntEnum
+from operator import attrgetter
+from struct import Struct
 
 # Source.Python
 from core import SOURCE_ENGINE_BRANCH
 from entities.helpers import index_from_edict
 
+from mathlib import Vector
+from mathlib import QAngle
+
+from players import UserCmd
 from players.bots import bot_manager
 from players.bots import BotCmd
 from players.entity import Player as SPPlayer
@@ -29,25 +38,69 @@ from listeners import OnEntityDeleted
 # >> CLASSES
 # ==============================================================================
 class Snapshot(object):
-    """This class is used to store properties/actions of a player at a single
-    game frame."""
+    """This class is used to access properties/actions of a player at a single
+    game frame.
+
+    A snapshot doesn't store any data itself. It's only a view of a single
+    frame of a :class:`Recording`. If the recording is frozen, every property
+    access decompresses the recording (see :meth:`Recording.thaw`).
+
+    A snapshot can stand for multiple consecutive ticks (see :attr:`repeat`).
+    Its bot command is the one of the first of these ticks.
+    """
+
+    __slots__ = ('recording', 'index')
 
-    def __init__(self, origin, angle, velocity, bcmd):
+    def __init__(self, recording, index):
         """Initialize the snapshot.
 
-        :param Vector origin:
-            The current location of the player.
-        :param QAngle angle:
-            The current angle of the player.
-        :param Vector velocity:
-            The current velocity of the player.
-        :param BotCmd bcmd:
-            The bot command of the player.
+        :param Recording recording:
+            The recording that contains the frame.
+        :param int index:
+            The index of the frame.
+        """
+        self.recording = recording
+        self.index = index
+
+    @property
+    def origin(self):
+        """Return the recorded location of the player.
+
+        :rtype: Vector
+        """
+        return Vector(*self.recording.get_frame(self.index)[0:3])
+
+    @property
+    def angle(self):
+        """Return the recorded angle of the player.
+
+        :rtype: QAngle
+        """
+        return QAngle(*self.recording.get_frame(self.index)[3:6])
+
+    @property
+    def velocity(self):
+        """Return the recorded velocity of the player.
+
+        :rtype: Vector
         """
-        self.origin = origin
-        self.angle = angle
-        self.velocity = velocity
-        self.bcmd = bcmd
+        return Vector(*self.recording.get_frame(self.index)[6:9])
+
+    @property
+    def bcmd(self):
+        """Return the recorded bot command of the player.
+
+        :rtype: BotCmd
+        """
+        return self.recording.get_bcmd(self.index)
+
+    @property
+    def repeat(self):
+        """Return the number of ticks this snapshot is replayed.
+
+        :rtype: int
+        """
+        return self.recording.repeats[self.index]
 
     def replay_bcmd(self, controller):
         """Replay the stored action using the given player."""
@@ -55,15 +108,18 @@ class Snapshot(object):
 
     def replay_location(self, player):
         """Correct the player's location."""
+        frame = self.recording.get_frame(self.index)
         player.teleport(
-            origin=self.origin,
-            angle=self.angle,
-            velocity=self.velocity)
+            origin=Vector(*frame[0:3]),
+            angle=QAngle(*frame[3:6]),
+            velocity=Vector(*frame[6:9]))
 
 
 class PlayerData(object):
     """A class to store player/client information."""
 
+    __slots__ = ('name', 'steamid', 'team')
+
     def __init__(self, name, steamid, team):
         """Initialize the instance.
 
@@ -79,10 +135,155 @@ class PlayerData(object):
         self.team = team
 
 
-class Recording(list):
+# Struct of the location part at the start of every frame (origin, angle and
+# velocity)
+LOCATION_STRUCT = Struct('<9f')
+
+# Struct of the origin at the start of every frame
+ORIGIN_STRUCT = Struct('<3f')
+
+# Attributes that are copied from a UserCmd to a BotCmd on all games and their
+# struct format. Vector and QAngle attributes are stored as three floats.
+BCMD_ATTRIBUTES = (
+    ('command_number', 'i'),
+    ('tick_count', 'i'),
+    ('view_angles', QAngle),
+    ('forward_move', 'f'),
+    ('side_move', 'f'),
+    ('up_move', 'f'),
+    ('buttons', 'i'),
+    ('impulse', 'B'),
+    ('weaponselect', 'i'),
+    ('weaponsubtype', 'i'),
+    ('random_seed', 'i'),
+    ('mousedx', 'h'),
+    ('mousedy', 'h'),
+    ('has_been_predicted', '?'),
+)
+
+# Additional attributes that are copied on specific games if both UserCmd and
+# BotCmd provide them
+GAME_BCMD_ATTRIBUTES = {
+    'csgo': (
+        ('aim_direction', Vector),
+        ('head_angles', QAngle),
+        ('head_offset', Vector),
+    ),
+}
+
+
+def compile_frame_functions(game):
+    """Compile the functions to pack and unpack a frame for the given game.
+
+    A frame consists of the location part (:data:`LOCATION_STRUCT`) followed
+    by the attributes of the player's user command that exist on the game's
+    UserCmd and BotCmd. The generated functions only contain straight-line
+    code for these attributes, so no attribute checks are necessary when
+    they are called.
+
+    :param str game:
+        The engine branch to compile the functions for.
+    :return:
+        The struct of a frame, a function to pack a frame into a buffer and a
+        function to unpack the bot command of a frame.
+    :rtype: tuple
+    """
+    attributes = tuple(
+        (name, kind)
+        for name, kind in BCMD_ATTRIBUTES + GAME_BCMD_ATTRIBUTES.get(game, ())
+        if hasattr(UserCmd, name) and hasattr(BotCmd, name))
+
+    bcmd_format = ''
+    pack_lines = ''
+    pack_values = ''
+    unpack_targets = ''
+    unpack_lines = ''
+    for name, kind in attributes:
+        if isinstance(kind, str):
+            bcmd_format += kind
+            pack_values += f'        ucmd.{name},\n'
+            unpack_targets += f'        bcmd.{name},\n'
+            continue
+
+        # Vector and QAngle attributes
+        components = ', '.join(f'{name}_{axis}' for axis in 'xyz')
+        bcmd_format += '3f'
+        pack_lines += f'    {name} = ucmd.{name}\n'
+        pack_values += f'        {name}.x, {name}.y, {name}.z,\n'
+        unpack_targets += f'        {components},\n'
+        unpack_lines += (
+            f'    bcmd.{name} = {kind.__name__}({components})\n')
+
+    frame_struct = Struct('<9f' + bcmd_format)
+    bcmd_struct = Struct('<' + bcmd_format)
+
+    source = (
+        'def pack_frame(buffer, offset, origin, angle, velocity, ucmd):\n'
+        f'{pack_lines}'
+        '    pack_into(\n'
+        '        buffer, offset,\n'
+        '        origin.x, origin.y, origin.z,\n'
+        '        angle.x, angle.y, angle.z,\n'
+        '        velocity.x, velocity.y, velocity.z,\n'
+        f'{pack_values}'
+        '    )\n'
+        '\n'
+        'def unpack_bcmd(buffer, offset, bcmd):\n'
+        '    (\n'
+        f'{unpack_targets}'
+        '    ) = unpack_from(buffer, offset + LOCATION_SIZE)\n'
+        f'{unpack_lines}'
+        '    return bcmd\n')
+
+    namespace = {
+        'Vector': Vector,
+        'QAngle': QAngle,
+        'LOCATION_SIZE': LOCATION_STRUCT.size,
+        'pack_into': frame_struct.pack_into,
+        'unpack_from': bcmd_struct.unpack_from,
+    }
+    exec(compile(source, f'<frame_functions_{game}>', 'exec'), namespace)
+
+    return frame_struct, namespace['pack_frame'], namespace['unpack_bcmd']
+
+FRAME_STRUCT, pack_frame, unpack_bcmd = compile_frame_functions(
+    SOURCE_ENGINE_BRANCH)
+
+# Number of bytes stored per frame
+FRAME_SIZE = FRAME_STRUCT.size
+
+# Number of frames a new recording reserves space for
+INITIAL_FRAME_CAPACITY = 1024
+
+# Attributes of a UserCmd that are compared to detect repeated snapshots.
+# A snapshot is only repeated if replaying it again wouldn't change the bot's
+# behaviour, so this includes all attributes that trigger actions.
+get_move_attributes = attrgetter(
+    'buttons', 'forward_move', 'side_move', 'up_move', 'impulse',
+    'weaponselect', 'weaponsubtype')
+
+# Components of a Vector or QAngle
+get_components = attrgetter('x', 'y', 'z')
+
+
+class Recording(object):
     """This class represents a recording.
 
-    A recording is a sequence of snapshots and some meta information.
+    A recording is a sequence of snapshots and some meta information. All
+    snapshots are packed into a single buffer (:data:`FRAME_SIZE` bytes per
+    frame) that contains the location, angle, velocity and user command of
+    the player.
+
+    Consecutive ticks with identical actions and location are run-length
+    encoded: instead of adding a new snapshot, the repeat count of the last
+    snapshot is increased. Therefore, ``len()`` and indexing refer to the
+    stored snapshots, not to ticks. Use :attr:`tick_count` to get the number
+    of recorded ticks. When a repeated snapshot is replayed, ``command_number``
+    and ``tick_count`` of its bot command are increased by one per tick, but
+    all other attributes (e.g. ``random_seed``) are replayed unchanged.
+
+    When a recording is finished, the buffer is compressed and only kept in
+    its compressed form while the recording isn't played.
     """
 
     def __init__(self, player):
@@ -97,6 +298,97 @@ class Recording(list):
         self.map_name = global_vars.map_name
         self.tick_interval = server.tick_interval
         self.player = PlayerData(player.name, player.steamid, player.team)
+        self.replay_bot_name = f'{self.player.name} (Replay Bot)'
+        self.frames = bytearray(INITIAL_FRAME_CAPACITY * FRAME_SIZE)
+        self.repeats = array('I')
+        self.tick_count = 0
+        self._last_key = None
+        self._duration = None
+        self._compressed_frames = None
+        self._label = None
+
+    def __len__(self):
+        """Return the number of snapshots.
+
+        :rtype: int
+        """
+        return len(self.repeats)
+
+    def __getitem__(self, index):
+        """Return the snapshot at the given index.
+
+        :param int/slice index:
+            The index of the snapshot. If a slice is given, a list of
+            snapshots is returned.
+        :rtype: Snapshot
+        """
+        if isinstance(index, slice):
+            return [
+                Snapshot(self, i)
+                for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('Snapshot index out of range.')
+
+        return Snapshot(self, index)
+
+    def __iter__(self):
+        """Iterate over all snapshots.
+
+        A frozen recording is decompressed once for the whole iteration and
+        frozen again afterwards.
+        """
+        frozen = self.frames is None
+        self.thaw()
+        try:
+            for index in range(len(self)):
+                yield Snapshot(self, index)
+        finally:
+            if frozen:
+                self.freeze()
+
+    def get_frame(self, index):
+        """Return the location, angle and velocity of the given frame.
+
+        :param int index:
+            The index of the frame.
+        :rtype: tuple
+        """
+        return LOCATION_STRUCT.unpack_from(
+            self._get_frames(), index * FRAME_SIZE)
+
+    def get_bcmd(self, index, bcmd=None):
+        """Return the bot command of the given frame.
+
+        :param int index:
+            The index of the frame.
+        :param BotCmd bcmd:
+            The bot command that should be filled. If ``None`` a new bot
+            command is created.
+        :rtype: BotCmd
+        """
+        if bcmd is None:
+            bcmd = BotCmd()
+
+        return unpack_bcmd(self._get_frames(), index * FRAME_SIZE, bcmd)
+
+    def _get_frames(self):
+        """Return the frame buffer.
+
+        If the recording is frozen, the whole buffer is decompressed
+        temporarily without keeping it. This happens on every call, so
+        :meth:`thaw` the recording before accessing many snapshots directly
+        and :meth:`freeze` it afterwards, or iterate over the recording.
+
+        :rtype: bytes
+        """
+        if self.frames is not None:
+            return self.frames
+
+        return zlib.decompress(self._compressed_frames)
 
     def remove(self):
         """Remove the recording from the recording database."""
@@ -109,7 +401,7 @@ class Recording(list):
 
         :rtype: bool
         """
-        return len(self) > 0
+        return self.tick_count > 0
 
     def play(self, replay_bot_name=None):
         """Get or create a :class:`Player` instance and start playing the
@@ -130,59 +422,71 @@ class Recording(list):
 
         :rtype: float
         """
-        return len(self) * self.tick_interval
+        if self._duration is not None:
+            return self._duration
 
-    def add_snapshot(self, player):
-        """Create a snapshot for the given player and add it to this recording.
+        return self.tick_count * self.tick_interval
 
-        :param players.entity.Player player:
-            The player for which a snapshot should be created.
+    def freeze(self):
+        """Mark the recording as finished and compress the frame buffer.
+
+        No snapshots must be added afterwards, which allows caching values
+        like the duration. If the recording isn't being played, only the
+        compressed buffer is kept until :meth:`thaw` is called. Freezing a
+        recording again after it has been thawed only releases the
+        decompressed buffer.
         """
-        self.append(self.create_snapshot(player))
+        if self._compressed_frames is None:
+            self._duration = self.tick_count * self.tick_interval
+            self._compressed_frames = zlib.compress(
+                self.frames[:len(self) * FRAME_SIZE])
+
+        # Players read the decompressed buffer directly
+        if recording_mgr.find_player(self) is None:
+            self.frames = None
+
+    def thaw(self):
+        """Decompress the frame buffer of a frozen recording, so it can be
+        played or its snapshots can be accessed without decompressing the
+        buffer on each access.
+        """
+        if self.frames is None:
+            self.frames = bytearray(zlib.decompress(self._compressed_frames))
+
+    def add_snapshot(self, player):
+        """Create a snapshot for the given player and add it to this recording.
 
-    @classmethod
-    def create_snapshot(cls, player):
-        """Create a snapshot of the given player.
+        If the player's actions and location didn't change since the last
+        snapshot, the repeat count of the last snapshot is increased instead.
 
         :param players.entity.Player player:
             The player for which a snapshot should be created.
         """
-        return Snapshot(
-            player.origin,
-            player.angles,
-            player.velocity,
-            cls.create_bcmd_from_ucmd(player.playerinfo.last_user_command))
-
-    @staticmethod
-    def create_bcmd_from_ucmd(ucmd):
-        """Transform a ``players.UserCmd`` into a ``players.bot.BotCmd``
-        instance.
-
-        :param UserCmd ucmd:
-            The user command to transform.
-        :rtype: BotCmd
-        """
-        bcmd = BotCmd()
-        bcmd.reset()
+        ucmd = player.playerinfo.last_user_command
+        origin = player.origin
+
+        # The origin is compared in steps of 0.1 units
+        x, y, z = get_components(origin)
+        key = (
+            get_move_attributes(ucmd), get_components(ucmd.view_angles),
+            round(x, 1), round(y, 1), round(z, 1))
+
+        self.tick_count += 1
+        if key == self._last_key:
+            self.repeats[-1] += 1
+            return
 
-        bcmd.command_number = ucmd.command_number
-        bcmd.tick_count = ucmd.tick_count
-        bcmd.view_angles = ucmd.view_angles
-        bcmd.forward_move = ucmd.forward_move
-        bcmd.side_move = ucmd.side_move
-        bcmd.up_move = ucmd.up_move
-        bcmd.buttons = ucmd.buttons
-        bcmd.impulse = ucmd.impulse
-        bcmd.weaponselect = ucmd.weaponselect
-        bcmd.weaponsubtype = ucmd.weaponsubtype
-        bcmd.random_seed = ucmd.random_seed
-        bcmd.mousedx = ucmd.mousedx
-        bcmd.mousedy = ucmd.mousedy
-        bcmd.has_been_predicted = ucmd.has_been_predicted
+        self._last_key = key
 
-        # TODO: Handle game specific attributes
+        # Double the capacity of the buffer if it's full
+        frames = self.frames
+        offset = len(self.repeats) * FRAME_SIZE
+        if offset + FRAME_SIZE > len(frames):
+            frames.extend(bytes(len(frames) or FRAME_SIZE))
 
-        return bcmd
+        pack_frame(
+            frames, offset, origin, player.angles, player.velocity, ucmd)
+        self.repeats.append(1)
 
 
 class PlayerState(IntEnum):
@@ -193,9 +497,22 @@ class PlayerState(IntEnum):
     STOPPED = 2
 
 
+# Raw value of PlayerState.PLAYING for fast comparisons in tick handlers
+PLAYING = PlayerState.PLAYING.value
+
+# Maximum squared distance between the replay bot and the recorded location
+# before the replay bot is adjusted (50 units). The distance is only computed
+# for players with adjusting enabled.
+ADJUST_DISTANCE_SQR = 2500.0
+
+
 class Player(object):
     """A class to play a recording."""
 
+    __slots__ = (
+        'tick', 'frame', 'repeat', 'recording', 'state', 'controller',
+        'replay_bot', 'adjust', 'bcmd')
+
     def __init__(self, recording, controller, replay_bot, adjust=True):
         """Initialize the player.
 
@@ -210,51 +527,70 @@ class Player(object):
             it differs too much from the recorded state.
         """
         self.tick = 0
+        self.frame = 0
+        self.repeat = 0
         self.recording = recording
-        self.state = PlayerState.PAUSED
+        self.state = PlayerState.PAUSED.value
         self.controller = controller
         self.replay_bot = replay_bot
         self.adjust = adjust
+        self.bcmd = BotCmd()
 
     def __del__(self):
         """Remove all item from the replay bot and kick him."""
         self.controller.remove_all_items(True)
         self.replay_bot.kick()
 
+    @property
+    def state_enum(self):
+        """Return the current state of the player.
+
+        The state is stored as a plain integer to speed up comparisons in
+        :meth:`handle_tick`.
+
+        :rtype: PlayerState
+        """
+        return PlayerState(self.state)
+
     @property
     def replay_bot_name(self):
         """Return the name of the replay bot.
 
         :rtype: str
         """
-        return f'{self.recording.player.name} (Replay Bot)'
+        return self.recording.replay_bot_name
 
     def start(self):
         """Start/restart the player (jump to the first snapshot."""
         self.tick = 0
+        self.frame = 0
+        self.repeat = self.recording.repeats[0]
         self.replay_bot.team = self.recording.player.team
         self.replay_bot.spawn(force=True)
         self.resume()
 
     def resume(self):
         """Resume the player."""
-        self.state = PlayerState.PLAYING
+        self.state = PlayerState.PLAYING.value
 
     def pause(self):
         """Pause the player."""
-        self.state = PlayerState.PAUSED
+        self.state = PlayerState.PAUSED.value
 
     def stop(self):
         """Stop the player (jump to the last snapshot)."""
-        self.tick = len(self.recording) - 1
-        self.state = PlayerState.STOPPED
+        self.tick = self.recording.tick_count - 1
+        self.frame = len(self.recording) - 1
+        self.repeat = 1
+        self.state = PlayerState.STOPPED.value
 
     def remaining_time(self):
         """Return the remaining time of the recording in seconds.
 
         :rtype: float
         """
-        return self.recording.duration - self.played_time
+        recording = self.recording
+        return (recording.tick_count - self.tick) * recording.tick_interval
 
     def played_time(self):
         """Return the played time of the recording in seconds.
@@ -264,22 +600,58 @@ class Player(object):
         return self.tick * self.recording.tick_interval
 
     def handle_tick(self):
-        if self.state != PlayerState.PLAYING:
+        if self.state != PLAYING:
             return
 
-        snapshot = self.recording[self.tick]
-        snapshot.replay_bcmd(self.controller)
+        # Bind frequently used attributes to locals
+        recording = self.recording
+        replay_bot = self.replay_bot
+        tick = self.tick
+        frame = self.frame
 
-        # Adjust location, angle and velocity if the recorded location differs
-        # too much from the bot's location. This will allow a difference of 50
-        # units.
-        if self.tick == 0 or (self.adjust and self.replay_bot.origin.get_distance_sqr(snapshot.origin) > 2500):
-            snapshot.replay_location(self.replay_bot)
+        frames = recording.frames
+        offset = frame * FRAME_SIZE
+        bcmd = unpack_bcmd(frames, offset, self.bcmd)
+
+        # Continue the command and tick numbers of the snapshot's first tick,
+        # if it is replayed repeatedly
+        step = recording.repeats[frame] - self.repeat
+        if step:
+            bcmd.command_number += step
+            bcmd.tick_count += step
 
-        if self.tick < len(self.recording)-1:
-            self.tick += 1
+        self.controller.run_player_move(bcmd)
+
+        # Adjust location, angle and velocity if the recorded location differs
+        # too much from the bot's location. The adjust flag is tested first,
+        # so the bot's origin is only retrieved if adjusting is enabled. The
+        # Snapshot and its Vector and QAngle objects are only created if the
+        # bot is actually teleported.
+        if tick == 0:
+            recording[frame].replay_location(replay_bot)
+        elif self.adjust:
+            bot_x, bot_y, bot_z = get_components(replay_bot.origin)
+            x, y, z = ORIGIN_STRUCT.unpack_from(frames, offset)
+            dx = bot_x - x
+            dy = bot_y - y
+            dz = bot_z - z
+            if dx*dx + dy*dy + dz*dz > ADJUST_DISTANCE_SQR:
+                recording[frame].replay_location(replay_bot)
+
+        # Stay on the current snapshot until all of its repeated ticks have
+        # been replayed
+        repeat = self.repeat
+        if repeat > 1:
+            self.repeat = repeat - 1
+        elif frame < len(recording)-1:
+            frame += 1
+            self.frame = frame
+            self.repeat = recording.repeats[frame]
         else:
-            self.state = PlayerState.STOPPED
+            self.state = PlayerState.STOPPED.value
+            return
+
+        self.tick = tick + 1
 
 
 class RecorderState(IntEnum):
@@ -290,9 +662,15 @@ class RecorderState(IntEnum):
     STOPPED = 2
 
 
+# Raw value of RecorderState.RECORDING for fast comparisons in tick handlers
+RECORDING = RecorderState.RECORDING.value
+
+
 class Recorder(object):
     """A class to record a player (client)."""
 
+    __slots__ = ('player', 'state', 'recording')
+
     def __init__(self, player):
         """Initialize the recorder.
 
@@ -300,29 +678,40 @@ class Recorder(object):
             The player to record.
         """
         self.player = player
-        self.state = RecorderState.PAUSED
+        self.state = RecorderState.PAUSED.value
         self.recording = None
 
+    @property
+    def state_enum(self):
+        """Return the current state of the recorder.
+
+        The state is stored as a plain integer to speed up comparisons in
+        :meth:`handle_tick`.
+
+        :rtype: RecorderState
+        """
+        return RecorderState(self.state)
+
     def start(self):
         """Start/restart the recording. If a recording was already started, it
         is discarded.
         """
         self.recording = Recording(self.player)
-        self.state = RecorderState.RECORDING
+        self.state = RecorderState.RECORDING.value
 
     def pause(self):
         """Pause the recorder."""
         if self.state == RecorderState.STOPPED:
             raise ValueError('Recorder is stopped.')
 
-        self.state = RecorderState.PAUSED
+        self.state = RecorderState.PAUSED.value
 
     def resume(self):
         """Resume the recorder."""
         if self.state == RecorderState.STOPPED:
             raise ValueError('Recorder is stopped.')
 
-        self.state = RecorderState.RECORDING
+        self.state = RecorderState.RECORDING.value
 
     def stop(self, save=True):
         """Stop the recorder. The current recording is added to the recording
@@ -333,24 +722,155 @@ class Recorder(object):
         :raise ValueError:
             Raised if the recorder was never started.
         """
-        self.state = RecorderState.STOPPED
+        self.state = RecorderState.STOPPED.value
 
         if save and self.recording is not None and self.recording not in recording_mgr:
+            self.recording.freeze()
             recording_mgr.append(self.recording)
 
     def handle_tick(self):
-        if self.state != RecorderState.RECORDING:
-            return
-
-        self.recording.add_snapshot(self.player)
+        if self.state == RECORDING:
+            self.recording.add_snapshot(self.player)
 
 
 class RecordingManager(list):
     """A class to manage recorders, players and recordings."""
 
+    # Recorders and players must only be added and removed through the
+    # methods of this class, so the caches below stay in sync with them
     recorders = dict()
     players = dict()
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the manager."""
+        super().__init__(*args, **kwargs)
+
+        # Counts the IDs of all saved recordings for fast membership tests.
+        # A count is kept per ID, because a recording can be added multiple
+        # times. All list methods that add or remove recordings keep it up to
+        # date.
+        self._ids = Counter(map(id, self))
+
+        # Maps the ID of a recording to a player that plays the recording
+        self._players_by_recording = dict()
+
+        # Tuples of all recorders and players for iterating them in on_tick.
+        # They are set to None whenever a recorder or player is added or
+        # removed and recreated on the next tick.
+        self._recorders_tuple = None
+        self._players_tuple = None
+
+    def __contains__(self, recording):
+        """Return whether the given recording is in the recording database.
+
+        :param Recording recording:
+            The recording to check.
+        :rtype: bool
+        """
+        return id(recording) in self._ids
+
+    def append(self, recording):
+        """Add a recording to the recording database.
+
+        :param Recording recording:
+            The recording to add.
+        """
+        super().append(recording)
+        self._ids[id(recording)] += 1
+
+    def remove(self, recording):
+        """Remove a recording from the recording database.
+
+        :param Recording recording:
+            The recording to remove.
+        :raise ValueError:
+            Raised if the recording is not in the recording database.
+        """
+        super().remove(recording)
+        self._discard_id(recording)
+
+    def clear(self):
+        """Remove all recordings from the recording database."""
+        super().clear()
+        self._ids.clear()
+
+    def pop(self, index=-1):
+        """Remove and return the recording at the given index.
+
+        :param int index:
+            Index of the recording.
+        :rtype: Recording
+        """
+        recording = super().pop(index)
+        self._discard_id(recording)
+        return recording
+
+    def insert(self, index, recording):
+        """Insert a recording into the recording database.
+
+        :param int index:
+            Index at which the recording is inserted.
+        :param Recording recording:
+            The recording to insert.
+        """
+        super().insert(index, recording)
+        self._ids[id(recording)] += 1
+
+    def extend(self, recordings):
+        """Add multiple recordings to the recording database.
+
+        :param iterable recordings:
+            The recordings to add.
+        """
+        super().extend(recordings)
+        self._update_ids()
+
+    def __iadd__(self, recordings):
+        """Add multiple recordings to the recording database.
+
+        :param iterable recordings:
+            The recordings to add.
+        """
+        self.extend(recordings)
+        return self
+
+    def __imul__(self, count):
+        """Repeat the recordings of the recording database in place.
+
+        :param int count:
+            Number of repetitions.
+        """
+        super().__imul__(count)
+        self._update_ids()
+        return self
+
+    def __setitem__(self, index, value):
+        """Replace one or more recordings of the recording database."""
+        super().__setitem__(index, value)
+        self._update_ids()
+
+    def __delitem__(self, index):
+        """Remove one or more recordings from the recording database."""
+        super().__delitem__(index)
+        self._update_ids()
+
+    def _discard_id(self, recording):
+        """Decrease the count of the given recording's ID.
+
+        :param Recording recording:
+            The recording that was removed once.
+        """
+        recording_id = id(recording)
+        count = self._ids[recording_id] - 1
+        if count > 0:
+            self._ids[recording_id] = count
+        else:
+            del self._ids[recording_id]
+
+    def _update_ids(self):
+        """Rebuild the IDs of all saved recordings."""
+        self._ids = Counter(map(id, self))
+
     def remove_player(self, index):
         """Remove the player for the given replay bot index.
 
@@ -364,6 +884,50 @@ class RecordingManager(list):
         else:
             player.stop()
             del self.players[index]
+            self._players_tuple = None
+
+            recording_id = id(player.recording)
+            if self._players_by_recording.get(recording_id) is player:
+                del self._players_by_recording[recording_id]
+
+                # Another player might still play the same recording
+                for other in self.players.values():
+                    if other.recording is player.recording:
+                        self._players_by_recording[recording_id] = other
+                        break
+                else:
+                    self._release_frames(player.recording)
+
+    def _release_frames(self, recording):
+        """Release the decompressed frames of a saved recording that isn't
+        played anymore.
+
+        :param Recording recording:
+            The recording that isn't played anymore.
+        """
+        if recording in self:
+            recording.freeze()
+
+    def clear_players(self):
+        """Remove all players."""
+        recordings = [player.recording for player in self.players.values()]
+        self.players.clear()
+        self._players_tuple = None
+        self._players_by_recording.clear()
+
+        for recording in recordings:
+            self._release_frames(recording)
+
+    def find_player(self, recording):
+        """Find a player for the given recording.
+
+        :param Recording recording:
+            The recording that is being played.
+        :return:
+            Return ``None`` if the recording is not being played.
+        :rtype: Player
+        """
+        return self._players_by_recording.get(id(recording))
 
     def get_player(self, recording, replay_bot_name=None):
         """Find a player for the given recording. If the recording is not being
@@ -375,9 +939,9 @@ class RecordingManager(list):
             Name of the replay bot if a new player is created.
         :rtype: Player
         """
-        for player in self.players.values():
-            if player.recording is recording:
-                return player
+        player = self.find_player(recording)
+        if player is not None:
+            return player
 
         return self.create_player(recording, replay_bot_name)
 
@@ -399,6 +963,8 @@ class RecordingManager(list):
         if not recording.is_playable():
             raise ValueError('Recording is not playable.')
 
+        recording.thaw()
+
         if replay_bot_name is None:
             replay_bot_name = self.create_replay_bot_name(recording)
 
@@ -413,6 +979,8 @@ class RecordingManager(list):
         replay_bot = SPPlayer(index_from_edict(replay_bot_edict))
         player = self.players[replay_bot.index] = Player(
             recording, controller, replay_bot, adjust)
+        self._players_tuple = None
+        self._players_by_recording.setdefault(id(recording), player)
 
         return player
 
@@ -422,7 +990,7 @@ class RecordingManager(list):
         :param Recording recording:
             The recording that will be played.
         """
-        return f'{recording.player.name} (Replay Bot)'
+        return recording.replay_bot_name
 
     def get_recorder(self, index):
         """Return the recorder for a given player/client.
@@ -435,6 +1003,7 @@ class RecordingManager(list):
             return self.recorders[index]
         except KeyError:
             recorder = self.recorders[index] = Recorder(SPPlayer(index))
+            self._recorders_tuple = None
             return recorder
 
     def remove_recorder(self, index, save=True):
@@ -452,6 +1021,7 @@ class RecordingManager(list):
 
         recorder.stop(save)
         del self.recorders[index]
+        self._recorders_tuple = None
 
 recording_mgr = RecordingManager()
 
@@ -460,11 +1030,26 @@ recording_mgr = RecordingManager()
 # >> LISTENERS
 # ==============================================================================
 @OnTick
-def on_tick():
-    for recorder in recording_mgr.recorders.values():
-        recorder.handle_tick()
+def on_tick(mgr=recording_mgr):
+    # The manager is bound as a default argument to avoid a global lookup on
+    # every tick. Iterating the cached tuples is cheaper than iterating the
+    # dictionaries.
+    recorders = mgr._recorders_tuple
+    if recorders is None:
+        recorders = mgr._recorders_tuple = tuple(mgr.recorders.values())
+
+    players = mgr._players_tuple
+    if players is None:
+        players = mgr._players_tuple = tuple(mgr.players.values())
+
+    if not recorders and not players:
+        return
 
-    for player in recording_mgr.players.values():
+    for recorder in recorders:
+        if recorder.state == RECORDING:
+            recorder.recording.add_snapshot(recorder.player)
+
+    for player in players:
         player.handle_tick()
 
 
@@ -493,11 +1078,14 @@ def on_menu_build(menu, index):
     menu.clear()
 
     for recording in recording_mgr:
-        menu.append(PagedOption(
-            '{} - {}'.format(
+        # Saved recordings never change, so the label is only created once
+        label = recording._label
+        if label is None:
+            label = recording._label = '{} - {}'.format(
                 time.strftime('%H:%M:%S', time.localtime(recording.creation_time)),
-                round(recording.duration, 2)),
-            recording))
+                round(recording.duration, 2))
+
+        menu.append(PagedOption(label, recording))
 
 @recording_menu.register_select_callback
 def on_menu_select(menu, index, option):
@@ -518,7 +1106,7 @@ def on_stop(info, x=None):
     print(recorder.recording.duration)
 
     if x is not None:
-        recording_mgr.players.clear()
+        recording_mgr.clear_players()
 
 @TypedSayCommand('!pause')
 def on_stop(info):